@@ -1,27 +1,125 @@
 import asyncio
-from typing import *
-from pydantic import BaseModel
+import atexit
+from threading import Lock
+from typing import Any, Awaitable, Callable, ClassVar, Coroutine, Dict, List, Optional, Tuple
 from logger import Logger
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
-class AsyncRunner(BaseModel):
+
+class AsyncRunner:
     """
     A class for managing and executing asynchronous coroutines.
 
     This class provides functionality to run single or multiple coroutines either in
-    an existing event loop or in a new one. It implements the singleton pattern to
-    ensure only one instance manages all async operations.
+    an existing event loop or in a shared one. It is never instantiated; all work goes
+    through its classmethods.
+
+    Coroutines that run outside an existing event loop use a single, lazily created
+    asyncio.Runner. A thread that finds the shared runner busy runs its coroutine in
+    a private runner instead.
 
     Attributes:
-        logger (Logger): Logger instance for the class
-        loop (asyncio.AbstractEventLoop | None): The event loop being used
+        _logger (Logger): Logger instance for the class
+        _runner (asyncio.Runner | None): The shared runner, created on first use
     """
-    class Config:
-        arbitrary_types_allowed = True
+
+    __slots__ = ()
 
     # Initialize the class-level logger
     _logger: ClassVar[Logger] = Logger.get_logger(name="AsyncRunner")
-    loop: Optional[asyncio.AbstractEventLoop] = None
+    _runner: ClassVar[Optional[asyncio.Runner]] = None
+    _runner_lock: ClassVar[Lock] = Lock()
+    _run_lock: ClassVar[Lock] = Lock()
+
+    @classmethod
+    def _new_runner_(cls) -> asyncio.Runner:
+        """Internal method to create a configured runner.
+
+        The runner's loop is a uvloop loop when uvloop is installed, and uses the eager
+        task factory where available (Python 3.12+), so coroutines that finish without
+        suspending never allocate a scheduled Task.
+
+        Returns:
+            asyncio.Runner: The new runner
+        """
+        runner: asyncio.Runner = asyncio.Runner(
+            loop_factory=uvloop.new_event_loop if uvloop is not None else None
+        )
+
+        eager_task_factory: Optional[Callable[..., asyncio.Task]] = getattr(
+            asyncio, "eager_task_factory", None
+        )
+
+        if eager_task_factory is not None:
+            runner.get_loop().set_task_factory(eager_task_factory)
+
+        return runner
+
+    @classmethod
+    def _get_runner_(cls) -> asyncio.Runner:
+        """Internal method to get the shared runner, creating it on first use.
+
+        Creation is guarded by a lock, so concurrent first calls share one runner.
+
+        Returns:
+            asyncio.Runner: The shared runner
+        """
+        if cls._runner is None:
+            with cls._runner_lock:
+                if cls._runner is None:
+                    cls._runner = cls._new_runner_()
+
+                    atexit.register(cls._runner.close)
+
+        return cls._runner
+
+    @classmethod
+    async def _gather_(cls, *awaitables: Awaitable[Any], return_exceptions: bool = False) -> List[Any]:
+        """Internal method to gather awaitables inside the runner's event loop.
+
+        Args:
+            *awaitables (Awaitable[Any]): The awaitables to gather
+            return_exceptions (bool): Whether to return exceptions as results instead of raising them
+
+        Returns:
+            List[Any]: The results of all awaitables
+        """
+        return await asyncio.gather(*awaitables, return_exceptions=return_exceptions)
+
+    @classmethod
+    def _dispatch_(cls, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        """Internal method to run a coroutine object according to the calling context.
+
+        Returns the coroutine unawaited when called from a running event loop. Otherwise
+        the coroutine runs in the shared event loop, or, if another thread is using that
+        loop, in a private loop that is closed afterwards. A caller never blocks on a loop
+        it does not drive itself.
+
+        Args:
+            coroutine (Coroutine[Any, Any, Any]): The coroutine object to run
+
+        Returns:
+            Any: The result of the coroutine, or the coroutine itself when called from a running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+            return coroutine
+        except RuntimeError:
+            pass
+
+        # A runner drives one coroutine at a time
+        if cls._run_lock.acquire(blocking=False):
+            try:
+                return cls._get_runner_().run(coroutine)
+            finally:
+                cls._run_lock.release()
+
+        with cls._new_runner_() as runner:
+            return runner.run(coroutine)
 
     @classmethod
     async def _run_coroutine_in_loop_(cls, coroutine: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any | None:
@@ -45,8 +143,14 @@ class AsyncRunner(BaseModel):
     def run_coroutine(cls, coroutine: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any | None:
         """Execute a single coroutine.
 
-        Attempts to run the coroutine in an existing event loop if available,
-        otherwise creates a new one.
+        The coroutine is dispatched depending on where the call happens:
+
+        - Called from inside a running event loop, the coroutine object is returned
+          unawaited. Blocking on it there would deadlock the loop, so the caller
+          must ``await`` the returned value.
+        - Called while another thread is using the shared event loop, the coroutine
+          is run in a private event loop.
+        - Otherwise, the coroutine is run in the shared event loop.
 
         Args:
             coroutine (Callable[..., Awaitable[Any]]): The coroutine function to execute
@@ -54,42 +158,21 @@ class AsyncRunner(BaseModel):
             **kwargs: Variable keyword arguments to pass to the coroutine
 
         Returns:
-            Any | None: The result of the coroutine execution, or None if an error occurred
+            Any | None: The result of the coroutine execution (or the awaitable coroutine
+                when called from a running event loop), or None if an error occurred
         """
-        try:
-            result: Any = None
-
-            try:
-                current_loop: Optional[asyncio.AbstractEventLoop] = (
-                    asyncio.get_event_loop()
-                )
-                cls._logger.info(message="Found running event loop for coroutine.")
-            except RuntimeError:
-                cls._logger.warning(message="Found no running event loop for coroutine.")
-                current_loop = None
-            
-            if current_loop and current_loop.is_running():
-                cls._logger.info(message="Running coroutine in the existing event loop.")
-                result = asyncio.create_task(
-                    coroutine(*args, **kwargs)
-                )
-            else:
-                cls._logger.info(message="Running coroutine in a new event loop.")
-                result = asyncio.run(coroutine(*args, **kwargs))
+        cls._logger.debug(message="Dispatching coroutine.")
 
-            cls._logger.info(message="Finished running coroutine.")
-
-            return result
-        except Exception as e:
-            cls._logger.error(message=f"Caught an exception while attempting to run coroutine: {e}")
-            return None
+        return cls._dispatch_(cls._run_coroutine_in_loop_(coroutine, *args, **kwargs))
 
     @classmethod
     def run_coroutines(cls, coroutines: List[Callable[..., Awaitable[Any]]], *args, **kwargs) -> List[Any] | None:
         """Execute multiple coroutines concurrently.
 
-        Runs multiple coroutines either in an existing event loop or creates a new one.
-        All coroutines are executed concurrently using asyncio.gather.
+        Runs multiple coroutines either in an existing event loop or in the shared one.
+        All coroutines are executed concurrently using asyncio.gather. Dispatch follows
+        the same rules as run_coroutine, so called from inside a running event loop the
+        gathering coroutine is returned for the caller to await.
 
         Args:
             coroutines (List[Callable[..., Awaitable[Any]]]): List of coroutine functions to execute
@@ -97,53 +180,44 @@ class AsyncRunner(BaseModel):
             **kwargs: Variable keyword arguments to pass to each coroutine
 
         Returns:
-            List[Any] | None: List of results from all coroutines, or None if an error occurred
+            List[Any] | None: List of results from all coroutines (or the awaitable gathering
+                coroutine when called from a running event loop), with None for every
+                coroutine that raised
         """
-        try:
-            results: List[Any] = []
+        cls._logger.debug(message="Dispatching coroutines.")
 
-            current_loop: asyncio.AbstractEventLoop | None
+        return cls._dispatch_(
+            cls._gather_(
+                *[
+                    cls._run_coroutine_in_loop_(coroutine, *args, **kwargs)
+                    for coroutine in coroutines
+                ]
+            )
+        )
 
-            try:
-                current_loop = (
-                    asyncio.get_event_loop()
-                )
+    @classmethod
+    def run_many(cls, jobs: List[Tuple[Callable[..., Awaitable[Any]], Tuple[Any, ...], Dict[str, Any]]]) -> List[Any] | None:
+        """Execute multiple coroutines concurrently, each with its own arguments.
 
-                cls._logger.info(message="Found running event loop for coroutines.")
-            except RuntimeError:
-                cls._logger.warning(
-                    message="Found no running event loop for coroutines."
-                )
+        Unlike run_coroutines, every job carries its own positional and keyword arguments,
+        and the coroutines are gathered directly without a per-coroutine wrapper. A failing
+        coroutine does not cancel the others; its exception is returned in its place.
 
-                current_loop = None
+        Args:
+            jobs (List[Tuple[Callable[..., Awaitable[Any]], Tuple[Any, ...], Dict[str, Any]]]): List of
+                (coroutine function, args, kwargs) tuples to execute
 
-            if current_loop and current_loop.is_running():
-                cls._logger.info(
-                    message="Running coroutines in the existing event loop."
-                )
-                results = current_loop.run_until_complete(
-                    asyncio.gather(
-                        *[
-                            cls._run_coroutine_in_loop_(coroutine, *args, **kwargs)
-                            for coroutine in coroutines
-                        ]
-                    )
-                )
-            else:
-                cls._logger.info(message="Running coroutines in a new event loop.")
-
-                results = asyncio.run(
-                    asyncio.gather(
-                        *[
-                            cls._run_coroutine_in_loop_(coroutine, *args, **kwargs)
-                            for coroutine in coroutines
-                        ]
-                    )
+        Returns:
+            List[Any] | None: List of results (or exceptions) in job order, or the awaitable gathering
+                coroutine when called from a running event loop, or None if an error occurred
+        """
+        try:
+            return cls._dispatch_(
+                cls._gather_(
+                    *[coroutine(*args, **kwargs) for coroutine, args, kwargs in jobs],
+                    return_exceptions=True,
                 )
-
-            cls._logger.info(message="Finished running coroutines.")
-
-            return results
+            )
         except Exception as e:
-            cls._logger.error(message=f"Caught an exception while attempting to run coroutine: {e}")
+            cls._logger.error(message=f"Caught an exception while attempting to run coroutines: {e}")
             return None
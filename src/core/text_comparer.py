@@ -1,40 +1,230 @@
+import asyncio
+import numpy as np
 import spacy
 
-from typing import *
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Iterator, List, Literal, Tuple
 
 from logger.logger import Logger
 
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
 
-class TextComparer:
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+def _cosine_similarity(
+    v1: np.ndarray,
+    v2: np.ndarray,
+) -> float:
     """
-    A singleton class for comparing text similarity using spaCy language models.
+    Compute the cosine similarity between two vectors.
 
-    This class provides functionality to load language models and compare text similarities
-    using spaCy's natural language processing capabilities. It implements the singleton
-    pattern to ensure efficient resource usage and maintains a cache of loaded language
-    models to improve performance.
+    Uses SimSIMD's SIMD cosine kernel when it is installed and falls back to NumPy
+    otherwise. Both float32 and int8 vectors are supported.
 
-    Attributes:
-        _shared_instance (Self | None): Singleton instance of the class
-        _language_models (Dict[str, spacy.Language]): Cache of loaded spaCy language models
+    Args:
+        v1 (np.ndarray): The first vector
+        v2 (np.ndarray): The second vector
+
+    Returns:
+        float: The cosine similarity of both vectors
+    """
+    if simsimd is not None:
+        # SimSIMD returns the cosine distance
+        return 1.0 - float(simsimd.cosine(v1, v2))
+
+    # Widen the vectors so that int8 dot products cannot overflow
+    v1 = v1.astype(np.float32, copy=False)
+    v2 = v2.astype(np.float32, copy=False)
+
+    return float(np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2)))
+
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    """
+    Scale a vector to unit length in place.
+
+    Zero vectors are left untouched, so they score 0.0 against any other vector just
+    like spaCy's Doc.similarity.
+
+    Args:
+        vector (np.ndarray): The vector to normalize
+
+    Returns:
+        np.ndarray: The normalized vector
+    """
+    norm: float = float(np.linalg.norm(vector))
+
+    if norm > 0.0:
+        vector /= norm
+
+    return vector
+
+
+# Snapshot of a loaded model: (language name, pipeline, whether it has static vectors)
+_Model = Tuple[str, spacy.Language, bool]
+
+# Pipeline components that do not contribute to document vectors
+_DISABLED_COMPONENTS: List[str] = [
+    "tagger",
+    "parser",
+    "attribute_ruler",
+    "lemmatizer",
+    "ner",
+]
+
+
+# Serializes model loading, since lru_cache lets concurrent misses all compute the value
+_load_spacy_lock: Lock = Lock()
+
+
+@lru_cache(maxsize=8)
+def _load_spacy_cached(name: str) -> spacy.Language:
+    """
+    Load a spaCy language model, caching it per name.
+
+    Pipeline components listed in _DISABLED_COMPONENTS are disabled. Call _load_spacy
+    instead, which makes sure every model is loaded only once.
+
+    Args:
+        name (str): The name of the spaCy language model to load
+
+    Returns:
+        spacy.Language: The loaded language model
+    """
+    return spacy.load(name, disable=_DISABLED_COMPONENTS)
+
+
+def _load_spacy(name: str) -> spacy.Language:
+    """
+    Load a spaCy language model once, even when called from several threads at a time.
+
+    Args:
+        name (str): The name of the spaCy language model to load
+
+    Returns:
+        spacy.Language: The loaded language model
     """
+    with _load_spacy_lock:
+        return _load_spacy_cached(name)
+
 
-    _shared_instance: Self | None = None
-    _language_models: Dict[str, spacy.Language] = {}
+if njit is not None:
 
-    def __new__(cls) -> Self:
+    # Explicit signatures compile the kernels at import time (and cache=True reuses
+    # the compiled code across processes), so the first comparison pays no JIT cost.
+    @njit("float32(float32[::1], float32[::1])", fastmath=True, cache=True)
+    def _dot(
+        a: np.ndarray,
+        b: np.ndarray,
+    ) -> float:
+        """
+        Compute the dot product of two vectors.
+
+        Args:
+            a (np.ndarray): The first C-contiguous float32 vector
+            b (np.ndarray): The second C-contiguous float32 vector
+
+        Returns:
+            float: The dot product of both vectors
+        """
+        dot = 0.0
+        for i in range(a.shape[0]):
+            dot += a[i] * b[i]
+        return dot
+
+    @njit(
+        "void(float32[:, ::1], float32[:, ::1], float32[:, ::1])",
+        parallel=True,
+        fastmath=True,
+        cache=True,
+    )
+    def _dot_matrix(
+        a: np.ndarray,
+        b: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """
+        Compute the pairwise dot products of the rows of two matrices.
+
+        Rows are expected to be normalized already, so every dot product is a cosine similarity.
+
+        Args:
+            a (np.ndarray): The (N, D) source matrix
+            b (np.ndarray): The (M, D) target matrix
+            out (np.ndarray): The (N, M) matrix to write the results into
         """
-        Create or return the singleton instance of TextComparer.
+        for i in prange(a.shape[0]):
+            for j in range(b.shape[0]):
+                dot = 0.0
+                for k in range(a.shape[1]):
+                    dot += a[i, k] * b[j, k]
+                out[i, j] = dot
+
+else:
+
+    def _dot(
+        a: np.ndarray,
+        b: np.ndarray,
+    ) -> float:
+        """
+        Compute the dot product of two vectors.
+
+        NumPy fallback used when Numba is not installed.
+
+        Args:
+            a (np.ndarray): The first C-contiguous float32 vector
+            b (np.ndarray): The second C-contiguous float32 vector
 
         Returns:
-            Self: The singleton instance of TextComparer
+            float: The dot product of both vectors
+        """
+        return np.dot(a, b)
+
+    def _dot_matrix(
+        a: np.ndarray,
+        b: np.ndarray,
+        out: np.ndarray,
+    ) -> None:
+        """
+        Compute the pairwise dot products of the rows of two matrices.
+
+        NumPy fallback used when Numba is not installed.
+
+        Args:
+            a (np.ndarray): The (N, D) source matrix
+            b (np.ndarray): The (M, D) target matrix
+            out (np.ndarray): The (N, M) matrix to write the results into
         """
-        if cls._shared_instance is None:
-            cls._shared_instance = super().__new__(cls)
-            cls._shared_instance.init()
-        return cls._shared_instance
+        np.dot(a, b.T, out=out)
 
-    def init(self) -> None:
+
+class TextComparer:
+    """
+    A class for comparing text similarity using spaCy language models.
+
+    This class provides functionality to load language models and compare text similarities
+    using spaCy's natural language processing capabilities. Use get_text_comparer() to
+    obtain the shared instance, so loaded language models and cached vectors are reused
+    across callers.
+
+    Attributes:
+        _vector_cache_size (int): Maximum number of normalized text vectors kept in the cache
+        _batch_size (int): Number of texts spaCy processes per batch
+    """
+
+    _vector_cache_size: int = 4096
+    _batch_size: int = 64
+
+    def __init__(self) -> None:
         """
         Initialize the TextComparer instance.
 
@@ -45,6 +235,12 @@ class TextComparer:
 
         self._language: str = ""
         self._nlp: spacy.Language | None = None
+        self._model: _Model | None = None
+        self._vector_cache: OrderedDict[Tuple[str, str], np.ndarray] = OrderedDict()
+        self._quantized_vector_cache: OrderedDict[Tuple[str, str], np.ndarray] = (
+            OrderedDict()
+        )
+        self._vector_cache_lock: Lock = Lock()
 
     @property
     def language(self) -> str:
@@ -71,18 +267,183 @@ class TextComparer:
             raise ValueError("Language cannot be empty")
         self._language = value
 
-    async def load_language(
+    def _get_model(
+        self,
+        language: str | None,
+    ) -> _Model:
+        """
+        Get a snapshot of the model to compare texts with.
+
+        Comparisons take this snapshot once and pass it on, so switching the language
+        while a comparison is in progress cannot mix models or cache vectors under the
+        wrong language.
+
+        Args:
+            language (str | None): The language model to use, loading it if needed. If not
+                provided, uses current model
+
+        Returns:
+            _Model: The (language, pipeline, has static vectors) snapshot
+
+        Raises:
+            RuntimeError: If no language model is loaded
+        """
+        if not language:
+            if self._model is None:
+                raise RuntimeError(
+                    "No language model loaded. Call load_language first."
+                )
+
+            return self._model
+
+        if self._language != language:
+            self.load_language(language=language)
+
+        nlp: spacy.Language = _load_spacy(language)
+
+        return (language, nlp, nlp.vocab.vectors.size > 0)
+
+    def _process(
+        self,
+        model: _Model,
+        texts: List[str],
+    ) -> Iterator[spacy.tokens.doc.Doc]:
+        """
+        Process several texts with a language model in batches.
+
+        Models that ship static word vectors (e.g. 'en_core_web_md') derive document
+        vectors from the token vectors alone, so the texts are only tokenized. Other models
+        run their remaining pipeline to compute the document tensors.
+
+        Args:
+            model (_Model): The model snapshot to process the texts with
+            texts (List[str]): The texts to process
+
+        Returns:
+            Iterator[spacy.tokens.doc.Doc]: The processed documents, in input order
+        """
+        _, nlp, static_vectors = model
+
+        if static_vectors:
+            return nlp.tokenizer.pipe(texts, batch_size=self._batch_size)
+
+        return nlp.pipe(texts, batch_size=self._batch_size, n_process=1)
+
+    def _get_vectors(
+        self,
+        model: _Model,
+        texts: List[str],
+    ) -> np.ndarray:
+        """
+        Get the normalized vectors of several texts stacked into a matrix.
+
+        Vectors are cached per (language, text) in a bounded LRU cache, so repeated texts
+        are neither processed nor normalized again. All texts missing from the cache are
+        processed in a single batch. The cache is guarded by a lock, so this method may be
+        called from worker threads.
+
+        Args:
+            model (_Model): The model snapshot to get the vectors with
+            texts (List[str]): The texts to get the vectors for
+
+        Returns:
+            np.ndarray: The (len(texts), D) float32 matrix of unit-length vectors
+        """
+        language: str = model[0]
+        vectors: Dict[str, np.ndarray] = {}
+
+        with self._vector_cache_lock:
+            for text in texts:
+                vector: np.ndarray | None = self._vector_cache.get((language, text))
+
+                if vector is not None:
+                    self._vector_cache.move_to_end((language, text))
+                    vectors[text] = vector
+
+        # Deduplicate while keeping the input order
+        missing: List[str] = [text for text in dict.fromkeys(texts) if text not in vectors]
+
+        if missing:
+            for text, doc in zip(missing, self._process(model=model, texts=missing)):
+                # Copy so the cache does not keep the processed document alive
+                vectors[text] = _normalize(np.array(doc.vector, dtype=np.float32))
+
+            with self._vector_cache_lock:
+                for text in missing:
+                    self._vector_cache[(language, text)] = vectors[text]
+
+                while len(self._vector_cache) > self._vector_cache_size:
+                    self._vector_cache.popitem(last=False)
+
+        return np.stack([vectors[text] for text in texts])
+
+    def _get_quantized_vectors(
+        self,
+        model: _Model,
+        texts: List[str],
+    ) -> np.ndarray:
+        """
+        Get the int8-quantized vectors of several texts stacked into a matrix.
+
+        Each normalized vector is scaled so that its largest component maps to 127. The
+        quantized vectors are kept in their own bounded LRU cache.
+
+        Args:
+            model (_Model): The model snapshot to get the vectors with
+            texts (List[str]): The texts to get the vectors for
+
+        Returns:
+            np.ndarray: The (len(texts), D) int8 matrix of quantized vectors
+        """
+        language: str = model[0]
+        vectors: Dict[str, np.ndarray] = {}
+
+        with self._vector_cache_lock:
+            for text in texts:
+                vector: np.ndarray | None = self._quantized_vector_cache.get(
+                    (language, text)
+                )
+
+                if vector is not None:
+                    self._quantized_vector_cache.move_to_end((language, text))
+                    vectors[text] = vector
+
+        # Deduplicate while keeping the input order
+        missing: List[str] = [text for text in dict.fromkeys(texts) if text not in vectors]
+
+        if missing:
+            for text, normalized in zip(missing, self._get_vectors(model=model, texts=missing)):
+                # Pipelines without vectors or tensors produce empty vectors
+                peak: float = float(np.max(np.abs(normalized), initial=0.0))
+                scale: float = 127.0 / peak if peak > 0.0 else 0.0
+
+                vectors[text] = np.round(normalized * scale).astype(np.int8)
+
+            with self._vector_cache_lock:
+                for text in missing:
+                    self._quantized_vector_cache[(language, text)] = vectors[text]
+
+                while len(self._quantized_vector_cache) > self._vector_cache_size:
+                    self._quantized_vector_cache.popitem(last=False)
+
+        return np.stack([vectors[text] for text in texts])
+
+    def load_language(
         self,
         language: str,
     ) -> None:
         """
-        Asynchronously load a spaCy language model.
+        Load a spaCy language model.
 
         This method loads the specified language model if it's not already loaded.
-        Previously loaded models are cached to improve performance.
+        Previously loaded models are cached module-wide to improve performance.
+
+        Models with static word vectors (e.g. 'en_core_web_md' or 'en_core_web_lg') are
+        recommended: 'en_core_web_sm' has none, so its similarity scores are less
+        meaningful and every text has to run through the pipeline.
 
         Args:
-            language (str): The name of the spaCy language model to load (e.g., 'en_core_web_sm')
+            language (str): The name of the spaCy language model to load (e.g., 'en_core_web_md')
 
         Raises:
             ValueError: If the language model name is empty
@@ -93,18 +454,13 @@ class TextComparer:
             raise ValueError("Language model name cannot be empty")
 
         try:
-            # Check if model is already loaded
-            if language in self._language_models:
-                self._nlp = self._language_models[language]
-                self._language = language
-                return
-
-            # Load new model
-            self._nlp = spacy.load(language)
-            self._language_models[language] = self._nlp
+            nlp: spacy.Language = _load_spacy(language)
+
+            self._nlp = nlp
             self._language = language
+            self._model = (language, nlp, nlp.vocab.vectors.size > 0)
 
-            self.logger.info(f"Successfully loaded language model '{language}'")
+            self.logger.debug(message=f"Successfully loaded language model '{language}'")
         except OSError as e:
             raise RuntimeError(
                 f"Failed to load language model '{language}'. Make sure it's installed: {e}"
@@ -120,48 +476,176 @@ class TextComparer:
         source: str,
         target: str,
         language: str | None = None,
+        precision: Literal["float32", "int8"] = "float32",
     ) -> float:
         """
         Compare two texts and return their similarity score.
 
         This method processes the input texts using spaCy and calculates their similarity
         using the loaded language model. If a different language model is specified, it
-        will be loaded automatically.
+        will be loaded automatically. Model loading and text processing run in worker
+        threads, so the event loop is not blocked.
+
+        With precision "int8" the vectors are quantized before scoring, trading a small
+        amount of accuracy for a quarter of the memory traffic.
 
         Args:
             source (str): The source text to compare
             target (str): The target text to compare against
             language (str | None): Optional language model to use. If not provided, uses current model
+            precision (Literal["float32", "int8"]): The vector precision to score with. Defaults to "float32"
 
         Returns:
             float: Similarity score between 0 and 1, where 1 indicates identical meaning
                   and 0 indicates completely different meaning
 
         Raises:
-            ValueError: If texts are empty or language model is not loaded
+            ValueError: If texts are empty, language model is not loaded or precision is unknown
             RuntimeError: If no language model is loaded
             Exception: For other unexpected errors during comparison
         """
         if not source or not target:
             raise ValueError("Source and target texts cannot be empty")
 
+        if precision not in ("float32", "int8"):
+            raise ValueError(f"Unknown precision '{precision}'")
+
         try:
-            # Load language if needed
-            if language and self._language != language:
-                await self.load_language(language=language)
+            # Pin the model for this comparison, loading it in a worker thread if needed
+            current: _Model | None = self._model
+            model: _Model = (
+                current
+                if current is not None and (not language or current[0] == language)
+                else await asyncio.to_thread(self._get_model, language=language)
+            )
 
-            if not self._nlp:
-                raise RuntimeError(
-                    "No language model loaded. Call load_language first."
+            # Like spaCy's Doc.similarity, identical texts score 1.0 even without vectors
+            if source == target:
+                return 1.0
+
+            if precision == "int8":
+                q1, q2 = await asyncio.to_thread(
+                    self._get_quantized_vectors,
+                    model=model,
+                    texts=[source, target],
                 )
 
+                # Match spaCy's behaviour for texts without vectors
+                if not q1.any() or not q2.any():
+                    return 0.0
+
+                return _cosine_similarity(v1=q1, v2=q2)
+
             # Process texts
-            doc1: spacy.tokens.doc.Doc = self._nlp(source)
-            doc2: spacy.tokens.doc.Doc = self._nlp(target)
+            v1, v2 = await asyncio.to_thread(
+                self._get_vectors,
+                model=model,
+                texts=[source, target],
+            )
 
-            return doc1.similarity(doc2)
+            # Both vectors are normalized, so their dot product is the cosine similarity
+            return float(_dot(v1, v2))
         except Exception as e:
             self.logger.error(
                 message=f"Caught an exception while attempting to compare texts: {e}"
             )
             raise
+
+    async def compare_similarity_matrix(
+        self,
+        sources: List[str],
+        targets: List[str],
+        language: str | None = None,
+    ) -> np.ndarray:
+        """
+        Compare every source text against every target text.
+
+        This method processes all input texts using spaCy and calculates the cosine
+        similarity of every (source, target) pair in a single batched kernel. If a
+        different language model is specified, it will be loaded automatically. Model
+        loading and text processing run in worker threads, so the event loop is not blocked.
+
+        Args:
+            sources (List[str]): The source texts to compare
+            targets (List[str]): The target texts to compare against
+            language (str | None): Optional language model to use. If not provided, uses current model
+
+        Returns:
+            np.ndarray: A (len(sources), len(targets)) float32 matrix of similarity scores
+
+        Raises:
+            ValueError: If no texts are given or any text is empty
+            RuntimeError: If no language model is loaded
+            Exception: For other unexpected errors during comparison
+        """
+        if not sources or not targets:
+            raise ValueError("Sources and targets cannot be empty")
+
+        if not all(sources) or not all(targets):
+            raise ValueError("Source and target texts cannot be empty")
+
+        try:
+            # Pin the model for this comparison, loading it in a worker thread if needed
+            current: _Model | None = self._model
+            model: _Model = (
+                current
+                if current is not None and (not language or current[0] == language)
+                else await asyncio.to_thread(self._get_model, language=language)
+            )
+
+            # Process texts, reusing cached vectors for texts seen before
+            vectors: np.ndarray = await asyncio.to_thread(
+                self._get_vectors,
+                model=model,
+                texts=[*sources, *targets],
+            )
+
+            a: np.ndarray = vectors[: len(sources)]
+            b: np.ndarray = vectors[len(sources) :]
+
+            out: np.ndarray = np.empty(
+                (a.shape[0], b.shape[0]),
+                dtype=np.float32,
+            )
+
+            _dot_matrix(a, b, out)
+
+            # Like spaCy's Doc.similarity, identical texts score 1.0 even without vectors
+            target_indices: Dict[str, List[int]] = {}
+
+            for index, target in enumerate(targets):
+                target_indices.setdefault(target, []).append(index)
+
+            for index, source in enumerate(sources):
+                if source in target_indices:
+                    out[index, target_indices[source]] = 1.0
+
+            return out
+        except Exception as e:
+            self.logger.error(
+                message=f"Caught an exception while attempting to compare texts: {e}"
+            )
+            raise
+
+
+_shared_text_comparer: TextComparer | None = None
+_shared_text_comparer_lock: Lock = Lock()
+
+
+def get_text_comparer() -> TextComparer:
+    """
+    Get the shared TextComparer instance, creating it on first use.
+
+    Creation is guarded by a lock, so concurrent first calls share one instance.
+
+    Returns:
+        TextComparer: The shared TextComparer instance
+    """
+    global _shared_text_comparer
+
+    if _shared_text_comparer is None:
+        with _shared_text_comparer_lock:
+            if _shared_text_comparer is None:
+                _shared_text_comparer = TextComparer()
+
+    return _shared_text_comparer
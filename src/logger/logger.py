@@ -4,6 +4,9 @@ from typing import *
 
 from level import Level
 
+# Position of each level in ascending order of severity
+_RANK: Dict[Level, int] = {level: index for index, level in enumerate(Level)}
+
 
 class Logger(BaseModel):
     """
@@ -198,6 +201,21 @@ class Logger(BaseModel):
             **kwargs,
         )
 
+    def is_enabled_for(
+        self,
+        level: Level,
+    ) -> bool:
+        """
+        Check whether messages of the given level are emitted by this logger.
+
+        Args:
+            level (Level): The logging level to check
+
+        Returns:
+            bool: True if the level is at or above this logger's minimum level
+        """
+        return _RANK[level] >= _RANK[self.level]
+
     def log(
         self,
         message: str,
@@ -212,6 +230,9 @@ class Logger(BaseModel):
             level (Level, optional): The severity level of the message. Defaults to Level.INFO
             **kwargs: Additional keyword arguments for future extensibility
         """
+        if not self.is_enabled_for(level):
+            return
+
         print(
             f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [{self.name}] {self._colourise_(level, message)}",
         )
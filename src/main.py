@@ -1,14 +1,14 @@
-from core.text_comparer import TextComparer
+from core.text_comparer import TextComparer, get_text_comparer
 from thread_runner.thread_runner import ThreadRunner
 
 
 def main() -> None:
-    text_comparer: TextComparer = TextComparer()
+    text_comparer: TextComparer = get_text_comparer()
 
     print(
         ThreadRunner.run_function(
             function=text_comparer.compare_similarity,
-            language="en_core_web_sm",
+            language="en_core_web_md",
             source="Hello",
             target="World",
         )
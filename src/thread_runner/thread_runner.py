@@ -58,12 +58,20 @@ class ThreadRunner:
                     loop=loop
                 )  # Set the new event loop for this thread
 
-                result: Any = loop.run_until_complete(
-                    future=function(
-                        *args,
-                        **kwargs,
+                try:
+                    result: Any = loop.run_until_complete(
+                        future=function(
+                            *args,
+                            **kwargs,
+                        )
                     )
-                )
+                finally:
+                    # Join the loop's executor threads (e.g. from asyncio.to_thread) and close it
+                    loop.run_until_complete(
+                        future=loop.shutdown_default_executor()
+                    )
+                    asyncio.set_event_loop(loop=None)
+                    loop.close()
             else:
                 # If it's a regular synchronous function, run it directly
                 result: Any = function(
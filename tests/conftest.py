@@ -0,0 +1,10 @@
+import sys
+
+from pathlib import Path
+
+SRC: Path = Path(__file__).resolve().parent.parent / "src"
+
+# The modules import each other relative to src, and the logger module imports its
+# level module as a top-level module
+sys.path.insert(0, str(SRC))
+sys.path.append(str(SRC / "logger"))
@@ -0,0 +1,24 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("spacy")
+
+from core.text_comparer import TextComparer
+
+
+@pytest.mark.parametrize("precision", ["float32", "int8"])
+def test_compare_similarity_without_vectors(precision: str) -> None:
+    """Pipelines without vectors or tensors score distinct texts 0.0 in both precisions."""
+    text_comparer: TextComparer = TextComparer()
+
+    similarity: float = asyncio.run(
+        text_comparer.compare_similarity(
+            source="hello world",
+            target="the cat sat",
+            language="blank:en",
+            precision=precision,
+        )
+    )
+
+    assert similarity == 0.0